@@ -0,0 +1,12 @@
+"""
+Shared pytest fixtures for the pywvschooldata tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def wv():
+    """The pywvschooldata module, imported once per test session."""
+    import pywvschooldata
+    return pywvschooldata
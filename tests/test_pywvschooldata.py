@@ -8,28 +8,21 @@ These just verify the Python wrapper imports and exposes expected functions.
 import pytest
 
 
-def test_import_package():
+def test_import_package(wv):
     """Package imports successfully."""
-    import pywvschooldata
-    assert pywvschooldata is not None
+    assert wv is not None
 
 
-def test_has_fetch_enr():
-    """fetch_enr function is available."""
-    import pywvschooldata
-    assert hasattr(pywvschooldata, 'fetch_enr')
-    assert callable(pywvschooldata.fetch_enr)
+@pytest.mark.parametrize(
+    'name', ['fetch_enr', 'fetch_enr_multi', 'tidy_enr', 'get_available_years']
+)
+def test_has_function(wv, name):
+    """Exported function is available."""
+    assert hasattr(wv, name)
+    assert callable(getattr(wv, name))
 
 
-def test_has_get_available_years():
-    """get_available_years function is available."""
-    import pywvschooldata
-    assert hasattr(pywvschooldata, 'get_available_years')
-    assert callable(pywvschooldata.get_available_years)
-
-
-def test_has_version():
+def test_has_version(wv):
     """Package has a version string."""
-    import pywvschooldata
-    assert hasattr(pywvschooldata, '__version__')
-    assert isinstance(pywvschooldata.__version__, str)
+    assert hasattr(wv, '__version__')
+    assert isinstance(wv.__version__, str)